@@ -1,7 +1,10 @@
 from fredapi import Fred
 import matplotlib as mpl
+import matplotlib.dates as mdates
 import matplotlib.pyplot as plt
+from matplotlib.collections import PolyCollection
 from config import FRED_API_KEY
+import numpy as np
 import pandas as pd
 
 
@@ -11,6 +14,7 @@ def unemp_graphs(
         xlabel="",
         ylabel="Percent",
         dpi=300,
+        recessions=None,
 ):
     fred = Fred(api_key=FRED_API_KEY)
     # dictionary: {FRED_code: legend_label}
@@ -41,6 +45,8 @@ def unemp_graphs(
     ax.yaxis.set_major_formatter("{x:,.0f}%")
     ax.grid()
     ax.legend(loc="best", frameon=True)
+    if recessions is not None:
+        add_recession_shading(ax, recessions)
 
     return data, ax
 def fred_pct_change_graph(
@@ -75,6 +81,7 @@ def LFPR_graph(
         xlabel="",
         ylabel="Percent",
         dpi=300,
+        recessions=None,
 ):
     fred = Fred(api_key=FRED_API_KEY)
     # dictionary: {FRED_code: legend_label}
@@ -105,6 +112,8 @@ def LFPR_graph(
     ax.yaxis.set_major_formatter("{x:,.0f}%")
     ax.grid()
     ax.legend(loc="best", frameon=True)
+    if recessions is not None:
+        add_recession_shading(ax, recessions)
 
     return data, ax
 
@@ -121,6 +130,7 @@ def plot_dataframe_series(
         has_grid=True,
         yaxis_format="{x:,.0f}%",
         show_legend=True,
+        recessions=None,
 ):
     """Plot one or more columns from a pre-fetched DataFrame."""
     if not isinstance(data, pd.DataFrame):
@@ -152,6 +162,8 @@ def plot_dataframe_series(
         ax.grid()
     if show_legend and plot_data.shape[1] > 1:
         ax.legend(loc="best", frameon=True)
+    if recessions is not None:
+        add_recession_shading(ax, recessions)
 
     # return plot_data, ax
 def add_fred_series_to_df(
@@ -219,3 +231,108 @@ def fetch_fred_series(
     if freq:
         data = data.resample(freq).mean()
     return data
+
+
+# Recession indicators fetched from FRED, keyed by series code, as
+# (indicator, spans) pairs so repeated plots skip both the fetch and the span
+# detection. Emptied whenever this module is reloaded.
+_RECESSION_INDICATORS = {}
+
+
+def _next_period(index):
+    """Returns the timestamp one period after the last entry of a DatetimeIndex."""
+    freq = index.freq
+    if freq is None and len(index) >= 3:
+        freq = pd.infer_freq(index)
+    if freq is not None:
+        return index[-1] + pd.tseries.frequencies.to_offset(freq)
+    if len(index) >= 2:
+        return index[-1] + (index[-1] - index[-2])
+    raise ValueError(
+        "cannot infer the period length of a single-observation indicator; "
+        "give its index a freq"
+    )
+
+
+def recession_spans(indicator):
+    """
+    Finds contiguous recession spans in a 0/1 indicator series.
+
+    Args:
+        indicator (pd.Series): Recession indicator (e.g., FRED USREC) with a
+            sorted DatetimeIndex. Missing values count as 0.
+
+    Returns:
+        tuple: One (start, end) pair of Timestamps per span. Each span ends at
+        the first non-recession observation, or one period past the last
+        observation if the series ends in a recession.
+    """
+    if not isinstance(indicator, pd.Series):
+        raise TypeError("indicator must be a pandas Series")
+    if not isinstance(indicator.index, pd.DatetimeIndex):
+        raise ValueError("indicator must have a DatetimeIndex")
+    if not indicator.index.is_monotonic_increasing:
+        raise ValueError("indicator index must be sorted in increasing order")
+
+    flags = indicator.fillna(0).to_numpy() > 0
+    edges = np.diff(np.concatenate(([0], flags.astype(np.int8), [0])))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+
+    index = indicator.index
+    if len(ends) and ends[-1] == len(index):
+        index = index.append(pd.DatetimeIndex([_next_period(index)]))
+    return tuple(zip(index[starts], index[ends]))
+
+
+def add_recession_shading(
+        ax,
+        indicator="USREC",
+        fred_api_key=FRED_API_KEY,
+        color="gray",
+        alpha=0.3,
+):
+    """
+    Shades recession periods on a time-series axis as a single artist.
+
+    Args:
+        ax (matplotlib.axes.Axes): Axis with a datetime x-axis.
+        indicator (pd.Series or str): 0/1 recession indicator, or a FRED series
+            code to fetch one. Defaults to "USREC". Fetched codes are cached
+            only until this module is reloaded; to reuse one across
+            importlib.reload calls, fetch it once and pass the Series.
+        fred_api_key (str): Your FRED API key, used when indicator is a code.
+        color (str): Fill color for the shaded spans.
+        alpha (float): Fill transparency.
+
+    Returns:
+        PolyCollection: The collection holding every shaded span.
+    """
+    if isinstance(indicator, str):
+        if indicator not in _RECESSION_INDICATORS:
+            series = fetch_fred_series(fred_api_key, indicator)[indicator]
+            _RECESSION_INDICATORS[indicator] = (series, recession_spans(series))
+        spans = _RECESSION_INDICATORS[indicator][1]
+    else:
+        spans = recession_spans(indicator)
+
+    starts = [start for start, _ in spans]
+    ends = [end for _, end in spans]
+    x0 = mdates.date2num(pd.DatetimeIndex(starts))
+    x1 = mdates.date2num(pd.DatetimeIndex(ends))
+
+    # Rectangles in data x / axes y coordinates, shape (n_spans, 4, 2)
+    verts = np.empty((len(spans), 4, 2))
+    verts[:, :, 0] = np.column_stack((x0, x0, x1, x1))
+    verts[:, :, 1] = (0, 1, 1, 0)
+
+    shading = PolyCollection(
+        verts,
+        facecolors=color,
+        edgecolors="none",
+        alpha=alpha,
+        transform=ax.get_xaxis_transform(),
+        zorder=0,
+    )
+    ax.add_collection(shading, autolim=False)
+    return shading